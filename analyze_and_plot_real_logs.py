@@ -6,16 +6,137 @@ Generates all graphs from Li-MSD paper
 Usage: python3 analyze_and_plot.py
 """
 
-import re
-import matplotlib.pyplot as plt
+import functools
+import hashlib
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
-from collections import defaultdict
 
-# Set publication-quality style
-plt.rcParams['figure.figsize'] = (10, 6)
-plt.rcParams['font.size'] = 12
-plt.rcParams['axes.grid'] = True
-plt.rcParams['grid.alpha'] = 0.3
+_matplotlib = None
+_pyplot = None
+
+def get_matplotlib():
+    """Import matplotlib on first use with the Agg backend and our style applied"""
+    global _matplotlib
+    if _matplotlib is None:
+        import matplotlib
+        matplotlib.use('Agg')  # file output only; no GUI backend in worker processes
+        
+        # Set publication-quality style
+        matplotlib.rcParams['figure.figsize'] = (10, 6)
+        matplotlib.rcParams['font.size'] = 12
+        matplotlib.rcParams['axes.grid'] = True
+        matplotlib.rcParams['grid.alpha'] = 0.3
+        
+        # Rendering fast paths: no TeX/mathtext parsing, simplified Agg paths
+        matplotlib.rcParams['text.usetex'] = False
+        matplotlib.rcParams['mathtext.default'] = 'regular'
+        matplotlib.rcParams['path.simplify'] = True
+        matplotlib.rcParams['path.simplify_threshold'] = 1.0
+        matplotlib.rcParams['agg.path.chunksize'] = 10000
+        
+        _matplotlib = matplotlib
+    return _matplotlib
+
+def get_pyplot():
+    """Import pyplot on first use, so CoojaLogAnalyzer users skip matplotlib"""
+    global _pyplot
+    if _pyplot is None:
+        get_matplotlib()
+        import matplotlib.pyplot as plt
+        _pyplot = plt
+    return _pyplot
+
+# PNG output settings. DRAFT=1 in the environment (any value but '' or '0')
+# drops to 100 dpi and zlib level 1, which is lossless and encodes faster
+# than the default level at the cost of larger files.
+DRAFT = os.getenv('DRAFT', '') not in ('', '0')
+SAVE_KW = {'dpi': 300, 'bbox_inches': 'tight'}
+if DRAFT:
+    SAVE_KW.update(dpi=100, pil_kwargs={'compress_level': 1})
+
+# Rendered PNGs are cached by a hash of this script, the plot arguments and
+# the effective rcParams (including any user matplotlibrc), so editing any
+# data, label or style invalidates them. Stale entries are never pruned (each
+# full render adds ~0.8 MB). NO_PNG_CACHE=1 (any value but '' or '0') always
+# re-renders and refreshes the cache.
+PNG_CACHE_DIR = 'results/.cache'
+NO_PNG_CACHE = os.getenv('NO_PNG_CACHE', '') not in ('', '0')
+_source = None
+
+def get_script_source():
+    """Read this script on first use; b'' if it has no readable __file__"""
+    global _source
+    if _source is None:
+        try:
+            with open(__file__, 'rb') as f:
+                _source = f.read()
+        except (NameError, OSError):
+            _source = b''
+    return _source
+
+def _arg_bytes(arg):
+    """Stable bytes for a plot argument: raw data for arrays, repr otherwise"""
+    if isinstance(arg, np.ndarray):
+        return f'{arg.dtype}{arg.shape}'.encode() + arg.tobytes()
+    if isinstance(arg, dict):
+        return b'{' + b'\0'.join(repr(k).encode() + b':' + _arg_bytes(v)
+                                 for k, v in sorted(arg.items())) + b'}'
+    if isinstance(arg, (list, tuple)):
+        return b'[' + b'\0'.join(_arg_bytes(v) for v in arg) + b']'
+    return repr(arg).encode()
+
+def _atomic_copy(src, dst):
+    """Copy src to dst via a temp file, so dst is never left half-written"""
+    tmp = f'{dst}.{os.getpid()}.tmp'
+    try:
+        shutil.copyfile(src, tmp)
+        os.replace(tmp, dst)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+def cached_png(fname):
+    """Reuse the cached render of fname unless its arguments or the script changed
+    
+    fname is the output path, or a callable mapping the plot arguments to it.
+    The key also covers SAVE_KW, the rcParams and the matplotlib version.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args):
+            path = fname(*args) if callable(fname) else fname
+            source = get_script_source()
+            if not source:
+                # Without the source the key cannot track edits; always render
+                return func(*args)
+            
+            # Applies our style without importing pyplot, so the hashed
+            # rcParams are the same on every call
+            matplotlib = get_matplotlib()
+            key = hashlib.blake2b(b'\0'.join([
+                source, func.__name__.encode(), path.encode(), _arg_bytes(args),
+                repr(SAVE_KW).encode(), repr(sorted(matplotlib.rcParams.items())).encode(),
+                matplotlib.__version__.encode()]),
+                digest_size=16).hexdigest()
+            cached = os.path.join(PNG_CACHE_DIR, f'{key}.png')
+            
+            if not NO_PNG_CACHE and os.path.exists(cached):
+                _atomic_copy(cached, path)
+                print(f"Saved: {path} (cached)")
+                return
+            
+            func(*args)
+            os.makedirs(PNG_CACHE_DIR, exist_ok=True)
+            _atomic_copy(path, cached)
+        return wrapper
+    return decorator
+
+# Raw counter order used by CoojaLogAnalyzer.counts and analyze_many
+COUNTERS = ('data_sent', 'data_received', 'dao_sent', 'dao_blocked',
+            'nodes_blacklisted', 'attack_count')
 
 class CoojaLogAnalyzer:
     def __init__(self, log_file):
@@ -28,25 +149,43 @@ class CoojaLogAnalyzer:
         self.attack_count = 0
         
     def analyze(self):
-        """Analyze Cooja log file"""
+        """Analyze Cooja log file
+        
+        Counters are per line, not per occurrence: the client logs
+        'DATA_TX: Sending packet ...', which must count as one packet.
+        """
         print(f"Analyzing: {self.log_file}")
         
-        with open(self.log_file, 'r') as f:
+        with open(self.log_file, 'r', buffering=1 << 20) as f:
             for line in f:
+                blocked = 'blocked' in line.lower()
+                
+                # Fast path: most lines match none of the counters below
+                if not (blocked or 'DATA' in line or 'RX [' in line or
+                        'packet' in line or 'BLACKLISTED' in line or
+                        'Attack count' in line):
+                    continue
+                
+                # Traffic lines (client, root, RPL) carry at most one of the
+                # next three messages, so stop at the first hit
+                
                 # Data packets sent
                 if 'DATA_TX:' in line or 'Sending packet' in line:
                     self.data_sent += 1
                 
                 # Data packets received
-                if 'DATA: Received' in line or 'RX [' in line:
+                elif 'DATA: Received' in line or 'RX [' in line:
                     self.data_received += 1
                 
                 # DAO messages sent
-                if 'packet sent to' in line and 'DAO' in line.upper():
+                elif 'packet sent to' in line and 'DAO' in line.upper():
                     self.dao_sent += 1
                 
-                # DAO blocked (Li-MSD)
-                if 'Blocked DAO' in line or 'blocked' in line.lower():
+                # Shield/attacker markers are checked on every line, since
+                # they may share a line with a traffic message or each other
+                
+                # DAO blocked (Li-MSD), covers 'Blocked DAO'
+                if blocked:
                     self.dao_blocked += 1
                 
                 # Nodes blacklisted
@@ -59,6 +198,21 @@ class CoojaLogAnalyzer:
         
         return self.get_metrics()
     
+    @classmethod
+    def analyze_many(cls, log_files):
+        """Analyze several log files into an (N, len(COUNTERS)) count array"""
+        counts = np.zeros((len(log_files), len(COUNTERS)), dtype=np.int64)
+        for i, log_file in enumerate(log_files):
+            analyzer = cls(log_file)
+            analyzer.analyze()
+            counts[i] = analyzer.counts
+        return counts
+    
+    @property
+    def counts(self):
+        """Raw counters as an array ordered like COUNTERS"""
+        return np.array([getattr(self, name) for name in COUNTERS], dtype=np.int64)
+    
     def get_metrics(self):
         """Calculate metrics"""
         pdr = (self.data_received / self.data_sent * 100) if self.data_sent > 0 else 0
@@ -75,198 +229,116 @@ class CoojaLogAnalyzer:
             'attack_count': self.attack_count
         }
 
-def plot_pdr_comparison(scenarios):
-    """Figure 6 & 7: PDR Comparison"""
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
-    
-    # Static scenario
-    replay_intervals = ['1s', '2s', '4s', '8s']
-    baseline_pdr = [98.5] * 4
-    under_attack = [52, 48, 55, 60]
-    with_limsd = [96, 95, 97, 98]
-    
-    x = np.arange(len(replay_intervals))
-    width = 0.25
-    
-    ax1.bar(x - width, baseline_pdr, width, label='Baseline (No Attack)', color='green', alpha=0.7)
-    ax1.bar(x, under_attack, width, label='Under Attack', color='red', alpha=0.7)
-    ax1.bar(x + width, with_limsd, width, label='With Li-MSD', color='blue', alpha=0.7)
-    
-    ax1.set_xlabel('DAO Replay Interval')
-    ax1.set_ylabel('Packet Delivery Ratio (%)')
-    ax1.set_title('PDR - Static Network')
-    ax1.set_xticks(x)
-    ax1.set_xticklabels(replay_intervals)
-    ax1.legend()
-    ax1.set_ylim([0, 105])
-    ax1.grid(True, alpha=0.3)
-    
-    # Mobile scenario
-    baseline_pdr_mobile = [95] * 4
-    under_attack_mobile = [38, 35, 40, 45]
-    with_limsd_mobile = [46, 47, 48, 47]
-    
-    ax2.bar(x - width, baseline_pdr_mobile, width, label='Baseline (No Attack)', color='green', alpha=0.7)
-    ax2.bar(x, under_attack_mobile, width, label='Under Attack', color='red', alpha=0.7)
-    ax2.bar(x + width, with_limsd_mobile, width, label='With Li-MSD', color='blue', alpha=0.7)
-    
-    ax2.set_xlabel('DAO Replay Interval')
-    ax2.set_ylabel('Packet Delivery Ratio (%)')
-    ax2.set_title('PDR - Mobile Network')
-    ax2.set_xticks(x)
-    ax2.set_xticklabels(replay_intervals)
-    ax2.legend()
-    ax2.set_ylim([0, 105])
-    ax2.grid(True, alpha=0.3)
-    
-    plt.tight_layout()
-    plt.savefig('results/fig_pdr_comparison.png', dpi=300, bbox_inches='tight')
-    print("Saved: results/fig_pdr_comparison.png")
-    plt.close()
+def metrics_from_counts(counts):
+    """Calculate metrics for every row of a CoojaLogAnalyzer.analyze_many array"""
+    counts = np.asarray(counts)
+    metrics = {name: counts[..., i] for i, name in enumerate(COUNTERS)}
+    sent = metrics['data_sent']
+    pdr = np.divide(metrics['data_received'], sent,
+                    out=np.zeros(sent.shape), where=sent > 0) * 100
+    metrics['pdr'] = pdr
+    metrics['plr'] = 100 - pdr
+    return metrics
 
-def plot_delay_comparison():
-    """Figure 8 & 9: Average End-to-End Delay"""
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
-    
-    replay_intervals = ['1s', '2s', '4s', '8s']
-    x = np.arange(len(replay_intervals))
-    width = 0.25
-    
-    # Static scenario
-    baseline_delay = [0.25, 0.26, 0.25, 0.27]
-    under_attack_delay = [2.5, 2.3, 1.8, 1.5]
-    with_limsd_delay = [0.45, 0.40, 0.35, 0.30]
-    
-    ax1.bar(x - width, baseline_delay, width, label='Baseline', color='green', alpha=0.7)
-    ax1.bar(x, under_attack_delay, width, label='Under Attack', color='red', alpha=0.7)
-    ax1.bar(x + width, with_limsd_delay, width, label='With Li-MSD', color='blue', alpha=0.7)
-    
-    ax1.set_xlabel('DAO Replay Interval')
-    ax1.set_ylabel('Average End-to-End Delay (s)')
-    ax1.set_title('AE2ED - Static Network')
-    ax1.set_xticks(x)
-    ax1.set_xticklabels(replay_intervals)
-    ax1.legend()
-    ax1.grid(True, alpha=0.3)
-    
-    # Mobile scenario
-    baseline_delay_mobile = [0.4, 0.42, 0.41, 0.43]
-    under_attack_mobile = [3.2, 3.0, 2.7, 2.5]
-    with_limsd_mobile = [1.28, 1.15, 1.0, 0.85]
-    
-    ax2.bar(x - width, baseline_delay_mobile, width, label='Baseline', color='green', alpha=0.7)
-    ax2.bar(x, under_attack_mobile, width, label='Under Attack', color='red', alpha=0.7)
-    ax2.bar(x + width, with_limsd_mobile, width, label='With Li-MSD', color='blue', alpha=0.7)
-    
-    ax2.set_xlabel('DAO Replay Interval')
-    ax2.set_ylabel('Average End-to-End Delay (s)')
-    ax2.set_title('AE2ED - Mobile Network')
-    ax2.set_xticks(x)
-    ax2.set_xticklabels(replay_intervals)
-    ax2.legend()
-    ax2.grid(True, alpha=0.3)
-    
-    plt.tight_layout()
-    plt.savefig('results/fig_delay_comparison.png', dpi=300, bbox_inches='tight')
-    print("Saved: results/fig_delay_comparison.png")
-    plt.close()
+# Grouped bar charts: Baseline / Under Attack / With Li-MSD per replay interval
+REPLAY_INTERVALS = ['1s', '2s', '4s', '8s']
+X = np.arange(len(REPLAY_INTERVALS))
+WIDTH = 0.25
+SERIES_COLORS = ('green', 'red', 'blue')
 
-def plot_power_consumption():
-    """Figure 10 & 11: Average Power Consumption"""
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
-    
-    replay_intervals = ['1s', '2s', '4s', '8s']
-    x = np.arange(len(replay_intervals))
-    width = 0.25
-    
-    # Static (mW)
-    baseline_power = [45, 46, 45, 47]
-    under_attack_power = [85, 82, 75, 70]
-    with_limsd_power = [50, 48, 47, 46]
-    
-    ax1.bar(x - width, baseline_power, width, label='Baseline', color='green', alpha=0.7)
-    ax1.bar(x, under_attack_power, width, label='Under Attack', color='red', alpha=0.7)
-    ax1.bar(x + width, with_limsd_power, width, label='With Li-MSD', color='blue', alpha=0.7)
-    
-    ax1.set_xlabel('DAO Replay Interval')
-    ax1.set_ylabel('Average Power Consumption (mW)')
-    ax1.set_title('APC - Static Network')
-    ax1.set_xticks(x)
-    ax1.set_xticklabels(replay_intervals)
-    ax1.legend()
-    ax1.grid(True, alpha=0.3)
-    
-    # Mobile
-    baseline_power_mobile = [55, 56, 55, 57]
-    under_attack_mobile = [95, 92, 88, 85]
-    with_limsd_mobile = [62, 60, 58, 57]
-    
-    ax2.bar(x - width, baseline_power_mobile, width, label='Baseline', color='green', alpha=0.7)
-    ax2.bar(x, under_attack_mobile, width, label='Under Attack', color='red', alpha=0.7)
-    ax2.bar(x + width, with_limsd_mobile, width, label='With Li-MSD', color='blue', alpha=0.7)
-    
-    ax2.set_xlabel('DAO Replay Interval')
-    ax2.set_ylabel('Average Power Consumption (mW)')
-    ax2.set_title('APC - Mobile Network')
-    ax2.set_xticks(x)
-    ax2.set_xticklabels(replay_intervals)
-    ax2.legend()
-    ax2.grid(True, alpha=0.3)
-    
-    plt.tight_layout()
-    plt.savefig('results/fig_power_comparison.png', dpi=300, bbox_inches='tight')
-    print("Saved: results/fig_power_comparison.png")
-    plt.close()
+FIGURES = [
+    # Figure 6 & 7: PDR Comparison
+    {
+        'fname': 'results/fig_pdr_comparison.png',
+        'ylabel': 'Packet Delivery Ratio (%)',
+        'titles': ('PDR - Static Network', 'PDR - Mobile Network'),
+        'baseline_label': 'Baseline (No Attack)',
+        'static': np.array([[98.5] * 4, [52, 48, 55, 60], [96, 95, 97, 98]]),
+        'mobile': np.array([[95] * 4, [38, 35, 40, 45], [46, 47, 48, 47]]),
+        'ylim': [0, 105],
+    },
+    # Figure 8 & 9: Average End-to-End Delay
+    {
+        'fname': 'results/fig_delay_comparison.png',
+        'ylabel': 'Average End-to-End Delay (s)',
+        'titles': ('AE2ED - Static Network', 'AE2ED - Mobile Network'),
+        'baseline_label': 'Baseline',
+        'static': np.array([[0.25, 0.26, 0.25, 0.27], [2.5, 2.3, 1.8, 1.5], [0.45, 0.40, 0.35, 0.30]]),
+        'mobile': np.array([[0.4, 0.42, 0.41, 0.43], [3.2, 3.0, 2.7, 2.5], [1.28, 1.15, 1.0, 0.85]]),
+        'ylim': None,
+    },
+    # Figure 10 & 11: Average Power Consumption (mW)
+    {
+        'fname': 'results/fig_power_comparison.png',
+        'ylabel': 'Average Power Consumption (mW)',
+        'titles': ('APC - Static Network', 'APC - Mobile Network'),
+        'baseline_label': 'Baseline',
+        'static': np.array([[45, 46, 45, 47], [85, 82, 75, 70], [50, 48, 47, 46]]),
+        'mobile': np.array([[55, 56, 55, 57], [95, 92, 88, 85], [62, 60, 58, 57]]),
+        'ylim': None,
+    },
+    # Figure 12 & 13: Packet Loss Ratio
+    {
+        'fname': 'results/fig_plr_comparison.png',
+        'ylabel': 'Packet Loss Ratio (%)',
+        'titles': ('PLR - Static Network', 'PLR - Mobile Network'),
+        'baseline_label': 'Baseline',
+        'static': np.array([[1.5, 1.4, 1.5, 1.3], [48, 52, 45, 40], [4, 5, 3, 2]]),
+        'mobile': np.array([[5, 4.8, 5.2, 4.5], [62, 65, 60, 55], [54, 53, 52, 53]]),
+        'ylim': None,
+    },
+]
 
-def plot_plr_comparison():
-    """Figure 12 & 13: Packet Loss Ratio"""
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
-    
-    replay_intervals = ['1s', '2s', '4s', '8s']
-    x = np.arange(len(replay_intervals))
-    width = 0.25
-    
-    # Static
-    baseline_plr = [1.5, 1.4, 1.5, 1.3]
-    under_attack_plr = [48, 52, 45, 40]
-    with_limsd_plr = [4, 5, 3, 2]
-    
-    ax1.bar(x - width, baseline_plr, width, label='Baseline', color='green', alpha=0.7)
-    ax1.bar(x, under_attack_plr, width, label='Under Attack', color='red', alpha=0.7)
-    ax1.bar(x + width, with_limsd_plr, width, label='With Li-MSD', color='blue', alpha=0.7)
-    
-    ax1.set_xlabel('DAO Replay Interval')
-    ax1.set_ylabel('Packet Loss Ratio (%)')
-    ax1.set_title('PLR - Static Network')
-    ax1.set_xticks(x)
-    ax1.set_xticklabels(replay_intervals)
-    ax1.legend()
-    ax1.grid(True, alpha=0.3)
-    
-    # Mobile
-    baseline_plr_mobile = [5, 4.8, 5.2, 4.5]
-    under_attack_mobile = [62, 65, 60, 55]
-    with_limsd_mobile = [54, 53, 52, 53]
-    
-    ax2.bar(x - width, baseline_plr_mobile, width, label='Baseline', color='green', alpha=0.7)
-    ax2.bar(x, under_attack_mobile, width, label='Under Attack', color='red', alpha=0.7)
-    ax2.bar(x + width, with_limsd_mobile, width, label='With Li-MSD', color='blue', alpha=0.7)
-    
-    ax2.set_xlabel('DAO Replay Interval')
-    ax2.set_ylabel('Packet Loss Ratio (%)')
-    ax2.set_title('PLR - Mobile Network')
-    ax2.set_xticks(x)
-    ax2.set_xticklabels(replay_intervals)
-    ax2.legend()
-    ax2.grid(True, alpha=0.3)
-    
-    plt.tight_layout()
-    plt.savefig('results/fig_plr_comparison.png', dpi=300, bbox_inches='tight')
-    print("Saved: results/fig_plr_comparison.png")
-    plt.close()
+# One figure per process. Reuse only pays off for serial or in-process callers
+# rendering several FIGURES entries; main() gives each pool worker roughly one
+# entry, so there every worker still builds its own figure once.
+_grouped_figure = None
 
+def get_grouped_figure():
+    """Lazily create the 1x2 figure shared by all FIGURES entries"""
+    global _grouped_figure
+    if _grouped_figure is None:
+        _grouped_figure = get_pyplot().subplots(1, 2, figsize=(14, 6))
+    return _grouped_figure
+
+@cached_png(lambda cfg: cfg['fname'])
+def plot_grouped_bars(cfg):
+    """Figures 6-13: static vs mobile grouped bar chart from a FIGURES entry"""
+    plt = get_pyplot()
+    fig, axes = get_grouped_figure()
+    # tight_layout starts from the current margins; reset them so a reused
+    # figure lays out exactly like a fresh one
+    fig.subplots_adjust(**{k: plt.rcParams[f'figure.subplot.{k}']
+                           for k in ('left', 'right', 'bottom', 'top', 'wspace', 'hspace')})
+    
+    labels = (cfg['baseline_label'], 'Under Attack', 'With Li-MSD')
+    for ax, title, data in zip(axes, cfg['titles'], (cfg['static'], cfg['mobile'])):
+        ax.clear()
+        # data is (3, len(X)): one row per series, offset around each tick
+        for i, (row, color, label) in enumerate(zip(data, SERIES_COLORS, labels)):
+            ax.bar(X + (i - 1) * WIDTH, row, WIDTH, label=label, color=color, alpha=0.7)
+        
+        ax.set_xlabel('DAO Replay Interval')
+        ax.set_ylabel(cfg['ylabel'])
+        ax.set_title(title)
+        ax.set_xticks(X)
+        ax.set_xticklabels(REPLAY_INTERVALS)
+        ax.legend()
+        if cfg['ylim'] is not None:
+            ax.set_ylim(cfg['ylim'])
+        ax.grid(True, alpha=0.3)
+    
+    fig.tight_layout()
+    fig.savefig(cfg['fname'], **SAVE_KW)
+    print(f"Saved: {cfg['fname']}")
+
+FPR_PNG = 'results/fig_fpr_comparison.png'
+MEMORY_PNG = 'results/fig_memory_overhead.png'
+
+@cached_png(FPR_PNG)
 def plot_fpr_comparison():
     """Figure 14: False Positive Rate"""
+    plt = get_pyplot()
     plt.figure(figsize=(10, 6))
     
     replay_intervals = ['1s', '2s', '4s', '8s']
@@ -287,12 +359,14 @@ def plot_fpr_comparison():
     plt.grid(True, alpha=0.3)
     
     plt.tight_layout()
-    plt.savefig('results/fig_fpr_comparison.png', dpi=300, bbox_inches='tight')
-    print("Saved: results/fig_fpr_comparison.png")
+    plt.savefig(FPR_PNG, **SAVE_KW)
+    print(f"Saved: {FPR_PNG}")
     plt.close()
 
+@cached_png(MEMORY_PNG)
 def plot_memory_overhead():
     """Figure 15: Memory Overhead"""
+    plt = get_pyplot()
     plt.figure(figsize=(10, 6))
     
     categories = ['ContikiRPL\n(Baseline)', 'SecRPL', 'Li-MSD', 'Z1 Max\nCapacity']
@@ -328,10 +402,13 @@ def plot_memory_overhead():
     autolabel(rects2)
     
     plt.tight_layout()
-    plt.savefig('results/fig_memory_overhead.png', dpi=300, bbox_inches='tight')
-    print("Saved: results/fig_memory_overhead.png")
+    plt.savefig(MEMORY_PNG, **SAVE_KW)
+    print(f"Saved: {MEMORY_PNG}")
     plt.close()
 
+# Column layout shared by the summary table header and rows
+SUMMARY_FMT = '{:<15} {:<12} {:<15} {:<15} {:<12}'
+
 def generate_summary_table():
     """Generate results summary table"""
     results = {
@@ -342,40 +419,23 @@ def generate_summary_table():
         'Improvement': ['+44%', '-44%', '-84%', '-41%', 'N/A', 'N/A']
     }
     
-    print("\n" + "="*80)
-    print("RESULTS SUMMARY TABLE")
-    print("="*80)
-    print(f"{'Metric':<15} {'Baseline':<12} {'Under Attack':<15} {'With Li-MSD':<15} {'Improvement':<12}")
-    print("-"*80)
+    # Format the table once, then send the same text to stdout and file
+    lines = ["="*80, "RESULTS SUMMARY TABLE", "="*80,
+             SUMMARY_FMT.format(*results), "-"*80]
+    lines += [SUMMARY_FMT.format(*map(str, row)) for row in zip(*results.values())]
+    lines.append("="*80)
+    text = "\n".join(lines) + "\n"
     
-    for i in range(len(results['Metric'])):
-        print(f"{results['Metric'][i]:<15} {str(results['Baseline'][i]):<12} "
-              f"{str(results['Under Attack'][i]):<15} {str(results['With Li-MSD'][i]):<15} "
-              f"{results['Improvement'][i]:<12}")
-    
-    print("="*80 + "\n")
+    print("\n" + text)
     
     # Save to file
     with open('results/summary_table.txt', 'w') as f:
-        f.write("="*80 + "\n")
-        f.write("RESULTS SUMMARY TABLE\n")
-        f.write("="*80 + "\n")
-        f.write(f"{'Metric':<15} {'Baseline':<12} {'Under Attack':<15} {'With Li-MSD':<15} {'Improvement':<12}\n")
-        f.write("-"*80 + "\n")
-        
-        for i in range(len(results['Metric'])):
-            f.write(f"{results['Metric'][i]:<15} {str(results['Baseline'][i]):<12} "
-                   f"{str(results['Under Attack'][i]):<15} {str(results['With Li-MSD'][i]):<15} "
-                   f"{results['Improvement'][i]:<12}\n")
-        
-        f.write("="*80 + "\n")
+        f.write(text)
     
     print("Saved: results/summary_table.txt")
 
 def main():
     """Main execution"""
-    import os
-    
     # Create results directory
     os.makedirs('results', exist_ok=True)
     
@@ -384,14 +444,15 @@ def main():
     print("="*60)
     print()
     
-    # Generate all graphs (using sample data)
+    # Generate all graphs (using sample data); each figure is independent,
+    # so render them in parallel
     print("Generating graphs...")
-    plot_pdr_comparison({})
-    plot_delay_comparison()
-    plot_power_consumption()
-    plot_plr_comparison()
-    plot_fpr_comparison()
-    plot_memory_overhead()
+    tasks = [(plot_grouped_bars, cfg) for cfg in FIGURES]
+    tasks += [(plot_fpr_comparison,), (plot_memory_overhead,)]
+    with ProcessPoolExecutor(max_workers=min(len(tasks), os.cpu_count() or 1)) as pool:
+        futures = [pool.submit(*task) for task in tasks]
+        for future in futures:
+            future.result()
     generate_summary_table()
     
     print("\n" + "="*60)